@@ -1,5 +1,12 @@
+import re
+from collections import deque
+from typing import Callable
+
 import numpy as np  # numpy is faster in math operations
+from scipy.spatial import cKDTree
 
+import bpa_kernels as kernels
+import trigonometry as trig
 from edge import Edge
 from face import Face
 from point import Point
@@ -18,26 +25,119 @@ class BallPivotingAlgorithm:
     To run -> initialise the class with a point cloud and radius, then call run() to run the algorithm. Other options are available to modify the user experience.
     """
 
-    faces = []
-    edges = []
+    # Number of rows the face and edge arrays are preallocated with, doubling whenever they are full
+    INITIAL_CAPACITY = 1024
+    # Number of iterations between progress messages when no progress callback is given
+    PROGRESS_INTERVAL = 1024
 
-    def __init__(self, radius: float, point_cloud: np.ndarray = None, file_location: str = None, iterations: int = None) -> None:
+    def __init__(self, radius: float, point_cloud: np.ndarray = None, file_location: str = None, iterations: int = None, progress: Callable = None) -> None:
         """
         Initializes the Ball Pivoting Algorithm with the given point cloud and radius.
-        :param point_cloud: The point cloud to be interpolated.
+        :param point_cloud: The point cloud to be interpolated, as an (N, 3) array of coordinates.
         :param radius: The radius of the ball used for pivoting.
+        :param progress: Optional wrapper for the range of iterations to report progress with (e.g. tqdm.tqdm), otherwise progress is printed every PROGRESS_INTERVAL iterations.
         """
-        self.point_cloud = point_cloud or np.ndarray([])
+        self.progress = progress
+        # Point cloud is stored as a contiguous (N, 3) array so x, y, z are read as packed columns
+        self.coords = np.empty((0, 3), dtype=np.float32)
+        if point_cloud is not None:
+            self.coords = np.ascontiguousarray(point_cloud, dtype=np.float32).reshape(-1, 3)
+        self._point_cloud = None
+        # Faces and edges are stored as rows of point indices, with Face and Edge objects only built when asked for
+        self.face_idx = np.empty((self.INITIAL_CAPACITY, 3), dtype=np.int32)
+        self.face_edges = np.empty((self.INITIAL_CAPACITY, 3), dtype=np.int32)
+        self.n_faces = 0
+        self.edge_idx = np.empty((self.INITIAL_CAPACITY, 2), dtype=np.int32)
+        self.edge_conn = np.zeros(self.INITIAL_CAPACITY, dtype=np.uint8)
+        self.n_edges = 0
+        # Row in edge_idx of the edge between each pair of points (smallest index first), so faces sharing a pair of points share the edge
+        self._edge_rows = {}
+        # Sorted point indices of every face, to check if a face already exists
+        self._triangles = set()
+        # The front of edges that can still be pivoted around, in the order their faces were created
+        self.front = deque()
+        # The mesh file faces are written to as they are created while running
+        self._out = None
+        self.radius = radius
+        # Squared radius is kept as float32 to match the coordinates in the distance kernels
+        self.radius_sq = np.float32(radius * radius)
+        self.file_location = None
         if file_location:
+            # Opening the file builds the KD-tree over its points
             self.open_point_cloud(file_location)
             self.file_location = file_location
-        self.radius = radius
+        else:
+            self.build_kdtree()
         if iterations:
             self.iterations=iterations
         else:
-            self.iterations = len(self.point_cloud)
+            self.iterations = len(self.coords)
+        return
+
+    @property
+    def point_cloud(self) -> np.ndarray:
+        """
+        The point cloud as an array of Point objects, only built when it is first needed.
+        :return: An array of Point objects, one per row of coords.
+        """
+        if self._point_cloud is None:
+            self._point_cloud = np.array([Point(location, index=i) for i, location in enumerate(self.coords)], dtype=object)
+        return self._point_cloud
+
+    def build_edges(self) -> list:
+        """
+        Builds the edges as a list of Edge objects from the edge arrays.
+        The list is a new snapshot on every call, so changes to it aren't stored (edges are added with _add_edge).
+        :return: A list of Edge objects, one per row of edge_idx.
+        """
+        points = self.point_cloud
+        edges = [Edge(points[i1], points[i2], int(i1), int(i2)) for i1, i2 in self.edge_idx[:self.n_edges]]
+        for edge, connections in zip(edges, self.edge_conn):
+            edge.connections = int(connections)
+        return edges
+
+    def build_faces(self) -> list:
+        """
+        Builds the faces as a list of Face objects from the face arrays.
+        The list is a new snapshot on every call, so changes to it aren't stored (faces are added with _add_face).
+        :return: A list of Face objects, one per row of face_idx.
+        """
+        points = self.point_cloud
+        edges = self.build_edges()
+        faces = [Face(tuple(points[i] for i in indexes), tuple(edges[e] for e in face_edges), tuple(int(i) for i in indexes)) for indexes, face_edges in zip(self.face_idx[:self.n_faces], self.face_edges)]
+        # Creating the faces adds connections to the edges, so they are reset to the stored counts
+        for edge, connections in zip(edges, self.edge_conn):
+            edge.connections = int(connections)
+        return faces
+
+    def build_kdtree(self) -> None:
+        """
+        Builds the KD-tree used for radius queries over the point cloud, clearing any cached neighbours.
+        """
+        # Coordinates are float32 throughout (half the memory of float64, and twice the values per SIMD register in the kernels)
+        # so a point cloud assigned to coords directly is converted once here rather than on every kernel call
+        self.coords = np.ascontiguousarray(self.coords, dtype=np.float32).reshape(-1, 3)
+        # The tree is built over a copy of the points sorted along a Morton (Z-order) curve so the points in each leaf are close together in memory
+        # coords keeps the file's order, so _tree_order maps the tree's indices back to it
+        self._tree_order = np.argsort(kernels.morton_codes(self.coords), kind='stable')
+        self.kdtree = cKDTree(self.coords[self._tree_order], leafsize=32, balanced_tree=True, compact_nodes=True)
+        # Neighbours of each point, filled in the first time the point is queried (each point is revisited by ~6 faces)
+        self._neighbours = [None] * len(self.coords)
+
         return
 
+    def radius_query(self, index: int) -> np.ndarray:
+        """
+        Finds the points within the radius of a point in the point cloud, caching the result as points are revisited when pivoting.
+        :param index: The index of the point in coords.
+        :return: An array of indices into coords of the points within the radius (including the point itself).
+        """
+        neighbours = self._neighbours[index]
+        if neighbours is None:
+            neighbours = np.sort(self._tree_order[self.kdtree.query_ball_point(self.coords[index], self.radius, return_sorted=False)])
+            self._neighbours[index] = neighbours
+        return neighbours
+
     def open_point_cloud(self, file_location: str) -> None:
         """
         Opens an object file, filtering out the points in the point cloud
@@ -48,112 +148,300 @@ class BallPivotingAlgorithm:
         if file_location.split('.')[-1] not in file_list:
             raise ValueError(f"Only able to read object data of types {file_list}")
 
-        with open(file_location, 'r') as f:
-            # Initialise points to be added to numpy array
-            points = []
+        with open(file_location, 'rb') as f:
+            data = f.read()
 
-            for line in f.readlines():
-                # There must be text in the line and it must be a vertex
-                if not len(line) > 3:
-                    continue
-                # Segments of string
-                segments = line.split()
+        # Only vertex lines are parsed, faces, normals, textures and comments are skipped by one regex over the whole file
+        vertices = re.findall(rb'^[ \t]*v[ \t].*', data, re.MULTILINE)
+        self.coords = np.loadtxt(vertices, usecols=(1, 2, 3), dtype=np.float32, ndmin=2)
 
-                if segments[0] != 'v': continue
+        # The Point objects, KD-tree and cached neighbours all belong to the previous point cloud
+        self._point_cloud = None
+        self.build_kdtree()
 
-                points.append([
-                        float(segments[1]),
-                        float(segments[2]),
-                        float(segments[3])
-                    ])
+        return
 
-            self.point_cloud = np.array([Point(point) for point in points])
+    def _add_edge(self, i1: int, i2: int) -> int:
+        """
+        Adds an edge between two points to the edge arrays, unless there is already one between them.
+        :param i1: The index of the first point in coords.
+        :param i2: The index of the second point in coords.
+        :return: The row of the edge in edge_idx, either the existing one or the new one.
+        """
+        key = (i1, i2) if i1 < i2 else (i2, i1)
+        edge = self._edge_rows.get(key)
+        if edge is not None:
+            return edge
+
+        if self.n_edges == len(self.edge_idx):
+            # Doubling the capacity keeps adding edges amortised O(1)
+            capacity = 2 * len(self.edge_idx)
+            self.edge_idx = np.resize(self.edge_idx, (capacity, 2))
+            self.edge_conn = np.resize(self.edge_conn, capacity)
+
+        edge = self.n_edges
+        self.edge_idx[edge] = (i1, i2)
+        self.edge_conn[edge] = 0
+        self.n_edges += 1
+        self._edge_rows[key] = edge
+
+        return edge
+
+    def _add_face(self, points: tuple, edges: tuple) -> int:
+        """
+        Adds a face to the face arrays, connecting its edges to it and pushing them onto the front.
+        :param points: The indices of the three points in coords.
+        :param edges: The rows of the three edges in edge_idx.
+        :return: The row of the new face in face_idx.
+        """
+        if self.n_faces == len(self.face_idx):
+            # Doubling the capacity keeps adding faces amortised O(1)
+            capacity = 2 * len(self.face_idx)
+            self.face_idx = np.resize(self.face_idx, (capacity, 3))
+            self.face_edges = np.resize(self.face_edges, (capacity, 3))
+
+        face = self.n_faces
+        self.face_idx[face] = points
+        self.face_edges[face] = edges
+        self.n_faces += 1
+        self._triangles.add(tuple(sorted(points)))
+
+        if self._out is not None:
+            # Object files index vertices from 1
+            self._out.write(f"f {points[0]+1} {points[1]+1} {points[2]+1}\n")
+
+        # Add connections to edges (There should be a maximum of 2 connections per edge so as not to overlap faces)
+        for edge in edges:
+            self.edge_conn[edge] += 1
+
+        # Edges that can still be pivoted around go on the front, in the same order of preference as get_new_edge
+        for edge in reversed(edges):
+            if self.edge_conn[edge] < 2:
+                self.front.append(edge)
+
+        return face
+
+    def get_new_edge(self, face: int) -> int:
+        """
+        Get a new edge of a face to start from to build a new face
+        :param face: The row of the face in face_idx.
+        :return: The row of the new edge in edge_idx, or None if all of the face's edges are connected.
+        """
+        # If an edge has 2 connections, don't use it because there will be overlap
+        for edge in reversed(self.face_edges[face]):
+            if self.edge_conn[edge] < 2:
+                return int(edge)
 
-        return
+        return None
 
-    def find_seed_triangle(self) -> Face:
+    def next_front_edge(self) -> int:
         """
-        Finds a seed triangle to start the algorithm.
-        :return: A seed triangle.
+        Pops the oldest edge on the front that can still be pivoted around.
+        :return: The row of the edge in edge_idx, or None if the front is empty.
         """
+        while self.front:
+            edge = self.front.popleft()
+            # Edges that have since been connected to a second face are discarded
+            if self.edge_conn[edge] < 2:
+                return edge
 
-        first_point = self.point_cloud[0]
+        return None
 
-        # Find second point by distance
-        neighbours, distances = first_point.find_neighbouring_vertices_with_distance(self.point_cloud, self.radius)
-        second_point = first_point.get_closest_point(neighbours, distances)
+    def find_third_point(self, i1: int, i2: int) -> int:
+        """
+        Find the third point of the triangle by pivoting the ball around the edge between two points
+        :param i1: The index of the first point of the edge in coords.
+        :param i2: The index of the second point of the edge in coords.
+        :return: The index of the third point in coords, or None if there isn't one.
+        """
 
-        first_edge = Edge(first_point, second_point)
-        self.edges.append(first_edge)
+        # Only points within the radius of either end of the edge are candidates
+        candidates = np.union1d(self.radius_query(i1), self.radius_query(i2))
+        candidates = candidates[(candidates != i1) & (candidates != i2)]
+        candidate_coords = self.coords[candidates]
+
+        # Order the candidates by the cosine of the angle from cosine rule for every candidate at once, using squared distances (so no sqrt is taken)
+        p1 = self.coords[i1]
+        p2 = self.coords[i2]
+        a = candidate_coords - p1
+        b = candidate_coords - p2
+        c = p2 - p1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            angle_order = trig.cosine_rule_order_from_squares(np.einsum('ij,ij->i', a, a), np.einsum('ij,ij->i', b, b), c[0]*c[0] + c[1]*c[1] + c[2]*c[2])
+        # Degenerate triangles (a point on top of the edge's points) have no angle
+        valid = np.isfinite(angle_order)
+
+        if self.n_faces > 0:
+            # A candidate sharing an edge with the end of the edge in the previous face would overlap it
+            last_face = self.face_idx[self.n_faces - 1]
+            if i1 in last_face or i2 in last_face:
+                valid &= (candidates != last_face[0]) & (candidates != last_face[1]) & (candidates != last_face[2])
+
+            # Calculate Normals for the previous triangle to check the candidates are on the other side of the edge
+            origin, second, third = self.coords[last_face]
+            vector1 = third - origin
+            vector2 = second - origin
+            # Vertical line on edge, 90 degrees to triangle: vector1 with its projection onto the edge vector2 rejected
+            # (the vector triple product expansion of cross(vector2, cross(vector1, vector2)), without building the triangle normal)
+            plane_normal = vector1 * np.dot(vector2, vector2) - vector2 * np.dot(vector2, vector1)
+            # Method of checking vector normals from Lotemn102's Ball-Pivoting-Algorithm implementation @ github.com/Lotemn102/Ball-Pivoting-Algorithm/
+            valid &= np.sign((candidate_coords - origin) @ plane_normal) == np.sign(np.dot(plane_normal, vector1))
+
+        # Sort the points by angle (the larger the angle, the closer the point is to the middle of the edge)
+        # Sorting by ascending cosine gives the same order
+        order = np.flatnonzero(valid)
+        order = order[np.argsort(angle_order[order], kind='stable')]
+
+        for candidate in order:
+            third = int(candidates[candidate])
+            # Skip faces that already exist
+            if tuple(sorted((i1, i2, third))) in self._triangles:
+                continue
+            # Skip points that already have an edge to either end of this one that is connected to 2 faces
+            if self._edge_full(i1, third) or self._edge_full(i2, third):
+                continue
+            return third
+
+        return None
+
+    def _edge_full(self, i1: int, i2: int) -> bool:
+        """
+        Checks if the edge between two points is already connected to 2 faces.
+        :param i1: The index of the first point in coords.
+        :param i2: The index of the second point in coords.
+        :return: True if there is an edge between the points with 2 connections, False otherwise.
+        """
+        edge = self._edge_rows.get((i1, i2) if i1 < i2 else (i2, i1))
+
+        return edge is not None and self.edge_conn[edge] >= 2
+
+    def find_seed_triangle(self) -> tuple:
+        """
+        Finds a seed triangle to start the algorithm.
+        :return: The indices of the three points of the seed triangle in coords.
+        """
+
+        first_index = 0
+
+        # Find second point by distance, picking the closest neighbour in the same pass as checking the radius
+        second_index, _ = kernels.closest_in_radius(self.coords, self.radius_query(first_index), first_index, self.radius_sq)
+        if second_index < 0:
+            raise ValueError(f"No points within a radius of {self.radius} of the first point to start a seed triangle from")
+        second_index = int(second_index)
 
         # Find third point through shared neighbour along edge (Cylindrical space)
-        third_point = first_edge.find_third_point(self.point_cloud, self.radius, self.faces)
-        
-        second_edge = Edge(second_point, third_point)
-        
-        third_edge = Edge(third_point, first_point)
+        # This is checked before anything is added, so a failed seed leaves no edges behind
+        third_index = self.find_third_point(first_index, second_index)
+        if third_index is None:
+            raise ValueError(f"No points within a radius of {self.radius} of the first edge to start a seed triangle from")
+
+        first_edge = self._add_edge(first_index, second_index)
+        self.edge_conn[first_edge] += 1
 
-        self.edges.append(second_edge)
-        self.edges.append(third_edge)
+        second_edge = self._add_edge(second_index, third_index)
+        third_edge = self._add_edge(third_index, first_index)
 
-        # np.where(xxx)[0][0] gets the index of the point in the point cloud for use in saving to file later
-        seed_triangle = Face((first_point, second_point, third_point), (first_edge, second_edge, third_edge), (np.where(self.point_cloud == first_point)[0][0], np.where(self.point_cloud == second_point)[0][0], np.where(self.point_cloud == third_point)[0][0]))
+        seed_triangle = (first_index, second_index, third_index)
+        self._add_face(seed_triangle, (first_edge, second_edge, third_edge))
 
         return seed_triangle
 
-    def pivot_ball(self, edge:Edge):
+    def pivot_ball(self, edge: int) -> tuple:
         """
         Pivots the ball around the given edge until it touches another point.
-        :param edge: The edge to pivot the ball around.
-        :return: The next triangle formed by the ball pivoting around the edge.
+        :param edge: The row of the edge to pivot the ball around in edge_idx.
+        :return: The indices of the three points of the next triangle formed by the ball pivoting around the edge, or None if the ball doesn't touch another point.
         """
-        
+        # An edge can only connect to 2 faces
+        if self.edge_conn[edge] >= 2:
+            return None
+
+        i1, i2 = (int(i) for i in self.edge_idx[edge])
+
         # Find third point of triangle
-        third_point = edge.find_third_point(self.point_cloud, self.radius, self.faces)
+        third_index = self.find_third_point(i1, i2)
+        if third_index is None:
+            return None
+        self.edge_conn[edge] += 1
 
-        second_edge = Edge(edge.p1, third_point)
-        third_edge = Edge(edge.p2, third_point)
-        self.edges.append(second_edge)
-        self.edges.append(third_edge)
+        second_edge = self._add_edge(i1, third_index)
+        third_edge = self._add_edge(i2, third_index)
 
-        self.edges = list(set(self.edges))
-        
-        (np.where(self.point_cloud == edge.p1)[0][0], np.where(self.point_cloud == edge.p2)[0][0], np.where(self.point_cloud == third_point)[0][0])
-        # np.where(xxx)[0][0] gets the index of the point in the point cloud for use in saving to file later
-        return Face((edge.p1, edge.p2, third_point), (edge, second_edge, third_edge), (np.where(self.point_cloud == edge.p1)[0][0], np.where(self.point_cloud == edge.p2)[0][0], np.where(self.point_cloud == third_point)[0][0]))
+        triangle = (i1, i2, third_index)
+        self._add_face(triangle, (edge, second_edge, third_edge))
 
-    def write_to_file(self, file_location:str=None) -> None:
+        return triangle
+
+    def _output_location(self, file_location: str = None) -> str:
         """
-        Writes the triangle mesh to an object file.
-        :param file_location: The location of the object file.
+        Gets the location of the object file the mesh is written for.
+        :param file_location: The location of the object file, defaulting to the file the point cloud was opened from.
+        :return: The location of the object file.
         """
 
         if file_location is None:
             file_location = self.file_location
+        if file_location is None:
+            raise ValueError("No file location given to write the mesh to")
+
+        return file_location
+
+    def _edited_location(self, file_location: str, suffix: str) -> str:
+        """
+        Gets the location of an object file next to the given one.
+        :param file_location: The location of the original object file.
+        :param suffix: The suffix added to the original file name.
+        :return: The location of the new object file.
+        """
+
         edited_file_location = file_location.split('.')
-        edited_file_location[-2] += '_edited'
+        edited_file_location[-2] += suffix
 
-        with open(".".join(edited_file_location), 'w') as f:
-            f.write(f"# {file_location}\n")
+        return ".".join(edited_file_location)
+
+    def _format_vertices(self, file_location: str) -> str:
+        """
+        Formats the point cloud's vertices as the start of an object file, once for every file they are written to.
+        :param file_location: The location of the original object file, written as a comment at the top.
+        :return: The comment and vertex lines.
+        """
+
+        # Vertices are formatted in bulk, as the shortest text that reads back as the same float32
+        # (so values read from a file are written as they were, where a fixed %g precision would add digits)
+        text = self.coords.astype(str)
+
+        return f"# {file_location}\n" + "".join(map("v {} {} {}\n".format, text[:, 0], text[:, 1], text[:, 2]))
+
+    def _write_point_cloud(self, file_location: str, vertices: str) -> None:
+        """
+        Writes the point cloud to an object file next to the given one.
+        :param file_location: The location of the original object file.
+        :param vertices: The formatted vertices from _format_vertices.
+        """
 
-            for point in self.point_cloud:
-                f.write(f"v {point.x} {point.y} {point.z}\n")
-            
+        with open(self._edited_location(file_location, '_point_cloud'), 'w') as f:
+            f.write(vertices)
+
+        return
+
+    def write_to_file(self, file_location:str=None) -> None:
+        """
+        Writes the triangle mesh to an object file.
+        :param file_location: The location of the object file.
+        """
+
+        file_location = self._output_location(file_location)
+        vertices = self._format_vertices(file_location)
+
+        with open(self._edited_location(file_location, '_edited'), 'w') as f:
+            f.write(vertices)
             f.write(f"\n")
 
-            for face in self.faces:
-                f.write(f"f {face.p1_index+1} {face.p2_index+1} {face.p3_index+1}\n")
+            # Object files index vertices from 1
+            np.savetxt(f, self.face_idx[:self.n_faces] + 1, fmt='f %d %d %d')
         
         # Create point cloud file
-        if file_location is None:
-            file_location = self.file_location
-        edited_file_location = file_location.split('.')
-        edited_file_location[-2] += '_point_cloud'
-        with open(".".join(edited_file_location), 'w') as f:
-            f.write(f"# {file_location}\n")
-
-            for point in self.point_cloud:
-                f.write(f"v {point.x} {point.y} {point.z}\n")
+        self._write_point_cloud(file_location, vertices)
 
         return
     
@@ -164,40 +452,61 @@ class BallPivotingAlgorithm:
         """
 
         # ! Not implemented yet. Don't worry about this
-        
-        for edge in self.edges:
-            if edge.connections < 2:
-                return True
-            
-        return False
+
+        return bool((self.edge_conn[:self.n_edges] < 2).any())
 
 
     def run(self):
         """
         Runs the Ball Pivoting Algorithm to compute a triangle mesh interpolating the point cloud.
-        :return: A triangle mesh interpolating the point cloud.
-        """
-        seed_triangle = self.find_seed_triangle()
-        self.faces.append(seed_triangle)
-        edge = seed_triangle.get_new_edge()
-        for i in range(self.iterations): # Only run x iterations if you only want x faces (If it's a large point cloud, creating the entire mesh will take a while)
-            
-            face = self.pivot_ball(edge)
-            self.faces.append(face)
-            
-            edge = face.get_new_edge() # Get the next edge to pivot around from the new face
-            print(f"Point: {i+1}/{self.iterations} ☑️")
-            k = 0
-            # If you can't find the next edge, check on all other faces to see if there is one available, if not, quit as there are no more faces to add
-            while edge == None:
-                if k > len(self.faces): self.write_to_file(); quit()
-                face = self.faces[k]
-                edge = face.get_new_edge()
-                k += 1
-
-        self.write_to_file()
-
-        return np.array([])
+        :return: A triangle mesh interpolating the point cloud, as an (F, 3) array of point indices for each face.
+        """
+        file_location = self._output_location()
+        vertices = self._format_vertices(file_location)
+        self._write_point_cloud(file_location, vertices)
+
+        # The vertices are known up front, so they are written first and each face is written as it's created
+        # (if the run is stopped, the faces so far are still saved)
+        try:
+            with open(self._edited_location(file_location, '_edited'), 'w') as self._out:
+                self._out.write(vertices)
+                self._out.write(f"\n")
+                self._pivot_faces()
+        finally:
+            self._out = None
+
+        return self.face_idx[:self.n_faces]
+
+    def _pivot_faces(self) -> None:
+        """
+        Creates the seed triangle and pivots the ball to create faces until the iterations run out or there are no more edges to pivot around.
+        """
+        self.find_seed_triangle()
+        edge = self.get_new_edge(0)
+        iterations = range(self.iterations)
+        if self.progress is not None:
+            iterations = self.progress(iterations)
+        for i in iterations: # Each iteration creates a face, so only run x iterations if you only want x faces (If it's a large point cloud, creating the entire mesh will take a while)
+
+            # Edges the ball can't pivot around don't use up an iteration, the oldest edge left on the front is tried instead
+            face = None
+            while face is None:
+                if edge is None:
+                    edge = self.next_front_edge()
+                if edge is None:
+                    break
+                face = self.pivot_ball(edge)
+                edge = None
+            # If there are no more edges on the front, stop as there are no more faces to add
+            if face is None:
+                break
+
+            edge = self.get_new_edge(self.n_faces - 1) # Get the next edge to pivot around from the new face
+            # Printing every iteration would take longer than the pivot itself
+            if self.progress is None and ((i + 1) % self.PROGRESS_INTERVAL == 0 or i + 1 == self.iterations):
+                print(f"Point: {i+1}/{self.iterations}")
+
+        return
 
 def main(radius:float, file_location:str, iterations:int):
 
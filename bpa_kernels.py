@@ -0,0 +1,100 @@
+import numpy as np
+from numba import njit
+
+# Signatures of the serial kernels, shared with the ahead-of-time build in build_kernels.py
+SIGNATURES = {
+    'closest_in_radius': 'Tuple((i8, f4))(f4[:,::1], i8[:], i8, f4)',
+    'morton_codes': 'u8[:](f4[:,::1])',
+}
+
+
+def _closest_in_radius(coords, candidates, q_idx, r2):
+    """
+    Find the closest point to a point in the point cloud within a radius, in a single pass without building a list of neighbours
+    :param coords: The (N, 3) coordinates of the point cloud
+    :param candidates: The indices into coords of the points to check
+    :param q_idx: The index into coords of the query point (skipped if it's a candidate)
+    :param r2: The squared radius to search within
+    :return: The index into coords of the closest point strictly inside the radius (-1 if there isn't one), and its squared distance
+    """
+
+    best_idx = -1
+    best_d2 = r2
+
+    for j in range(candidates.shape[0]):
+        i = candidates[j]
+        if i == q_idx:
+            continue
+        dx = coords[i, 0] - coords[q_idx, 0]
+        dy = coords[i, 1] - coords[q_idx, 1]
+        dz = coords[i, 2] - coords[q_idx, 2]
+        d2 = dx * dx + dy * dy + dz * dz
+        if d2 < best_d2:
+            best_d2 = d2
+            best_idx = i
+
+    return best_idx, best_d2
+
+
+# Compiled lazily, into morton_codes when it is compiled (ahead of time by build_kernels.py, or JIT compiled the first time it is called)
+@njit(cache=True)
+def _spread_bits(x):
+    """
+    Spread the lower 21 bits of an integer out so there are two zero bits between each of them
+    :param x: The integer to spread
+    :return: The spread integer
+    """
+
+    x &= 0x1fffff
+    x = (x | (x << 32)) & 0x1f00000000ffff
+    x = (x | (x << 16)) & 0x1f0000ff0000ff
+    x = (x | (x << 8)) & 0x100f00f00f00f00f
+    x = (x | (x << 4)) & 0x10c30c30c30c30c3
+    x = (x | (x << 2)) & 0x1249249249249249
+
+    return x
+
+
+def _morton_codes(coords):
+    """
+    Find the Morton (Z-order) code of every point, so sorting by it keeps nearby points close together in memory
+    :param coords: The (N, 3) coordinates to encode
+    :return: An array of N 63 bit Morton codes (21 bits per axis)
+    """
+
+    n = coords.shape[0]
+    codes = np.empty(n, dtype=np.uint64)
+    if n == 0:
+        return codes
+
+    low = np.empty(3, dtype=np.float64)
+    high = np.empty(3, dtype=np.float64)
+    for axis in range(3):
+        low[axis] = coords[0, axis]
+        high[axis] = coords[0, axis]
+    for i in range(n):
+        for axis in range(3):
+            low[axis] = min(low[axis], coords[i, axis])
+            high[axis] = max(high[axis], coords[i, axis])
+
+    # Quantise each axis onto a 21 bit grid over the bounding box
+    scale = np.empty(3, dtype=np.float64)
+    for axis in range(3):
+        extent = high[axis] - low[axis]
+        scale[axis] = (2**21 - 1) / extent if extent > 0 else 0.0
+
+    for i in range(n):
+        x = np.uint64((coords[i, 0] - low[0]) * scale[0])
+        y = np.uint64((coords[i, 1] - low[1]) * scale[1])
+        z = np.uint64((coords[i, 2] - low[2]) * scale[2])
+        codes[i] = _spread_bits(x) | (_spread_bits(y) << 1) | (_spread_bits(z) << 2)
+
+    return codes
+
+
+# Kernels compiled ahead of time by build_kernels.py are used when they have been built, so they aren't JIT compiled on every run
+try:
+    from _bpa_kernels import closest_in_radius, morton_codes
+except ImportError:
+    closest_in_radius = njit(SIGNATURES['closest_in_radius'], fastmath=True, cache=True, boundscheck=False)(_closest_in_radius)
+    morton_codes = njit(SIGNATURES['morton_codes'], cache=True, boundscheck=False)(_morton_codes)
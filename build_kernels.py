@@ -0,0 +1,14 @@
+from numba.pycc import CC
+
+import bpa_kernels as kernels
+
+# Compiles the serial kernels into the _bpa_kernels extension module next to this file, which bpa_kernels imports instead of JIT compiling them
+# pycc has no fastmath option, and doesn't check bounds (the same as the JIT kernels' boundscheck=False)
+cc = CC('_bpa_kernels')
+cc.export('closest_in_radius', kernels.SIGNATURES['closest_in_radius'])(kernels._closest_in_radius)
+cc.export('morton_codes', kernels.SIGNATURES['morton_codes'])(kernels._morton_codes)
+
+
+if __name__ == '__main__':
+    # Run this once after installing the requirements: python build_kernels.py
+    cc.compile()
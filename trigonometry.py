@@ -17,6 +17,23 @@ def cosine_rule(a:float, b:float, c:float) -> float:
 
         return angleC
 
+def cosine_rule_order_from_squares(a_squared:float, b_squared:float, c_squared:float) -> float:
+        """
+        Calculate a value that orders the angles 'C' of triangles the same as their cosines, using the cosine rule on squared side lengths without a sqrt
+        (the signed square of the cosine rises and falls with the cosine, and the larger the angle, the smaller it is)
+        :param a_squared: The squared length of side 'a'
+        :param b_squared: The squared length of side 'b'
+        :param c_squared: The squared length of side 'c'
+        :return: 4 * cos(C) * |cos(C)| of the triangle
+        """
+        numerator = a_squared + b_squared - c_squared
+        order = np.divide(
+            np.multiply(np.sign(numerator), np.multiply(numerator, numerator)),
+            np.multiply(a_squared, b_squared)
+        )
+
+        return order
+
 def sine_rule_for_side(a:float, A:float, C:float) -> float:
     """
     Calculate the length of side 'b' of a triangle using the sine rule